@@ -1,7 +1,7 @@
+import os
+
 import streamlit as st
-import pickle
-import warnings
-from sklearn.exceptions import InconsistentVersionWarning
+import numpy as np
 
 # Configure Streamlit page
 st.set_page_config(
@@ -10,8 +10,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Static page chrome, assembled once at import time so reruns reuse the
+# same strings instead of re-parsing the triple-quoted literals.
+_CSS = """
     <style>
         .main {
             padding: 0rem 1rem;
@@ -29,255 +30,263 @@ st.markdown("""
             border-radius: 0.5rem;
             margin-bottom: 2rem;
         }
-        .section-header {
-            background-color: #e6e9ef;
-            padding: 0.5rem;
-            border-radius: 0.3rem;
-            margin-bottom: 1rem;
-        }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+_HEADER = """
+    <div class="header-container">
+        <h1 style='text-align: center;'>🏥 Diabetes Risk Assessment</h1>
+        <p style='text-align: center;'>Complete all fields below for an accurate assessment of diabetes risk factors.</p>
+    </div>
+"""
+
+_STATIC_HEAD = _CSS + _HEADER
+
+_FOOTER = """
+    <div style='text-align: center; color: #666;'>
+        <small>
+            This tool is for educational purposes only. Always consult with healthcare
+            professionals for medical advice.
+        </small>
+    </div>
+"""
 
 @st.cache_resource
 def load_model():
-    try:
-        with open("predictor.pickle", 'rb') as file:
-            return pickle.load(file)
-    except FileNotFoundError:
-        st.error("Model file not found. Please ensure 'predictor.pickle' is in the correct location.")
+    # Imported lazily so the form renders without paying the onnxruntime
+    # import cost; @st.cache_resource means this only ever runs once.
+    import onnxruntime as ort
+
+    if not os.path.exists("predictor.onnx"):
+        st.error("Model file not found. Please ensure 'predictor.onnx' is in the correct location.")
         return None
+    # Tune the session for the single/few-row path: apply all graph
+    # optimizations once at load, and skip the intra-op thread pool whose
+    # dispatch overhead outweighs any parallelism on a handful of rows.
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = 1
+    session = ort.InferenceSession(
+        "predictor.onnx", sess_options=options, providers=["CPUExecutionProvider"]
+    )
+    input_name = session.get_inputs()[0].name
+    # Warm-up run so the first real prediction doesn't pay kernel setup cost.
+    session.run(None, {input_name: np.zeros((1, 19), dtype=np.float32)})
+    return session, input_name
 
-def predict(feature_list):
+# Shared widget options, hoisted to module scope so reruns don't rebuild them.
+_YESNO = (("No", 0.0), ("Yes", 1.0))
+_SEX = (("Female", 0.0), ("Male", 1.0))
+_fmt = lambda x: x[0]
+
+# (widget key, label) pairs for the Yes/No selectboxes in each form column.
+LEFT_FIELDS = (
+    ("high_bp", "High Blood Pressure"),
+    ("high_chol", "High Cholesterol"),
+    ("chol_check", "Regular Cholesterol Check"),
+    ("stroke", "History of Stroke"),
+    ("heart_disease", "Heart Disease/Attack"),
+)
+MIDDLE_FIELDS = (
+    ("phys_activity", "Regular Physical Activity"),
+    ("fruits", "Daily Fruit Consumption"),
+    ("veggies", "Daily Vegetable Consumption"),
+    ("smoker", "Smoking Status"),
+    ("alcohol", "Heavy Alcohol Consumption"),
+    ("diff_walk", "Difficulty Walking"),
+)
+
+# Display labels for the 1-indexed slider options.
+_AGE_LABELS = (
+    "18-24", "25-29", "30-34", "35-39", "40-44", "45-49",
+    "50-54", "55-59", "60-64", "65-69", "70-74", "75-79", "80+"
+)
+_EDU_LABELS = (
+    "Never attended/kindergarten",
+    "Elementary (1-8)",
+    "Some high school",
+    "High school graduate",
+    "Some college",
+    "College graduate"
+)
+_INCOME_LABELS = (
+    "<$10,000", "<$20,000", "<$25,000", "<$30,000",
+    "<$35,000", "<$50,000", "<$60,000", "≥$75,000"
+)
+_GEN_HEALTH_LABELS = ("Excellent", "Very Good", "Good", "Fair", "Poor")
+
+# Widget keys in the feature order the model was trained on.
+_FEATURE_KEYS = (
+    "high_bp", "high_chol", "chol_check", "bmi", "smoker", "stroke",
+    "heart_disease", "phys_activity", "fruits", "veggies", "alcohol",
+    "gen_health", "mental_health", "phys_health", "diff_walk", "sex",
+    "age", "education", "income",
+)
+
+# Keys whose widgets hold (label, value) option tuples rather than bare values.
+_OPTION_KEYS = frozenset(
+    key for key, _ in LEFT_FIELDS + MIDDLE_FIELDS
+) | {"sex"}
+
+@st.cache_data(persist="disk", max_entries=10_000, show_spinner=False)
+def predict(features: tuple):
+    """Score one 19-feature tuple, cached so identical submissions skip the model."""
     model = load_model()
     if model is None:
         return None
-    return model.predict([feature_list])[0]
+    session, input_name = model
+    # Single-pass construction with known dtype and count; no intermediate
+    # list and no dtype probing, and no buffer shared across sessions.
+    row = np.fromiter(features, dtype=np.float32, count=19).reshape(1, 19)
+    return int(session.run(None, {input_name: row})[0][0])
+
+def _gather_features():
+    state = st.session_state
+    return tuple(
+        state[key][1] if key in _OPTION_KEYS else state[key]
+        for key in _FEATURE_KEYS
+    )
+
+def _on_submit():
+    # Runs in the submit callback, before the rerun; the rerun itself only
+    # reads the stored result instead of recomputing.
+    st.session_state["result"] = predict(_gather_features())
 
 def main():
-    # Header Section
-    st.markdown("""
-        <div class="header-container">
-            <h1 style='text-align: center;'>🏥 Diabetes Risk Assessment</h1>
-            <p style='text-align: center;'>Complete all fields below for an accurate assessment of diabetes risk factors.</p>
-        </div>
-    """, unsafe_allow_html=True)
-
-    # Create three main columns for the form
-    left_col, middle_col, right_col = st.columns([1, 1, 1])
-
-    # Left Column - Basic Health Metrics
-    with left_col:
-        st.markdown("""
-            <div class="section-header">
-                <h3>📊 Basic Health Metrics</h3>
-            </div>
-        """, unsafe_allow_html=True)
-        
-        bmi = st.number_input(
-            "BMI (Body Mass Index)",
-            min_value=18.0,
-            max_value=50.0,
-            value=25.0,
-            step=0.1,
-            help="Body Mass Index is a measure of body fat based on height and weight"
-        )
-
-        high_bp = st.selectbox(
-            "High Blood Pressure",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        high_chol = st.selectbox(
-            "High Cholesterol",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        chol_check = st.selectbox(
-            "Regular Cholesterol Check",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        stroke = st.selectbox(
-            "History of Stroke",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        heart_disease = st.selectbox(
-            "Heart Disease/Attack",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-    # Middle Column - Lifestyle Factors
-    with middle_col:
-        st.markdown("""
-            <div class="section-header">
-                <h3>🎯 Lifestyle & Habits</h3>
-            </div>
-        """, unsafe_allow_html=True)
-
-        phys_activity = st.selectbox(
-            "Regular Physical Activity",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        fruits = st.selectbox(
-            "Daily Fruit Consumption",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        veggies = st.selectbox(
-            "Daily Vegetable Consumption",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        smoker = st.selectbox(
-            "Smoking Status",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        alcohol = st.selectbox(
-            "Heavy Alcohol Consumption",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        diff_walk = st.selectbox(
-            "Difficulty Walking",
-            options=[("No", 0.0), ("Yes", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-    # Right Column - Personal Information
-    with right_col:
-        st.markdown("""
-            <div class="section-header">
-                <h3>👤 Personal Information</h3>
-            </div>
-        """, unsafe_allow_html=True)
-
-        sex = st.selectbox(
-            "Sex",
-            options=[("Female", 0.0), ("Male", 1.0)],
-            format_func=lambda x: x[0]
-        )[1]
-
-        age = st.select_slider(
-            "Age Group",
-            options=list(range(1, 14)),
-            format_func=lambda x: [
-                "18-24", "25-29", "30-34", "35-39", "40-44", "45-49",
-                "50-54", "55-59", "60-64", "65-69", "70-74", "75-79", "80+"
-            ][x-1]
-        )
-
-        education = st.select_slider(
-            "Education Level",
-            options=list(range(1, 7)),
-            format_func=lambda x: [
-                "Never attended/kindergarten",
-                "Elementary (1-8)",
-                "Some high school",
-                "High school graduate",
-                "Some college",
-                "College graduate"
-            ][x-1]
-        )
-
-        income = st.select_slider(
-            "Annual Income",
-            options=list(range(1, 9)),
-            format_func=lambda x: [
-                "<$10,000", "<$20,000", "<$25,000", "<$30,000",
-                "<$35,000", "<$50,000", "<$60,000", "≥$75,000"
-            ][x-1]
-        )
-
-    # Health Status Section - Full Width
-    st.markdown("---")
-    st.markdown("""
-        <div class="section-header">
-            <h3>🏥 Health Status</h3>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        gen_health = st.select_slider(
-            "General Health",
-            options=[1.0, 2.0, 3.0, 4.0, 5.0],
-            value=3.0,
-            format_func=lambda x: ["Excellent", "Very Good", "Good", "Fair", "Poor"][int(x-1)]
-        )
-    
-    with col2:
-        mental_health = st.slider(
-            "Days of Poor Mental Health (Last 30 days)",
-            min_value=0,
-            max_value=30,
-            value=0
-        )
-    
-    with col3:
-        phys_health = st.slider(
-            "Days of Poor Physical Health (Last 30 days)",
-            min_value=0,
-            max_value=30,
-            value=0
-        )
-
-    # Prediction Button and Results
-    st.markdown("---")
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col2:
-        if st.button("Generate Risk Assessment", type="primary"):
-            feature_list = [
-                high_bp, high_chol, chol_check, bmi, smoker, stroke,
-                heart_disease, phys_activity, fruits, veggies, alcohol,
-                gen_health, mental_health, phys_health, diff_walk, sex,
-                age, education, income
-            ]
-            
-            with st.spinner("Analyzing your data..."):
-                prediction_result = predict(feature_list)
-                
-                if prediction_result is not None:
-                    st.markdown("### Assessment Results")
-                    if prediction_result == 1:
-                        st.error("⚠️ **Higher Risk Detected**\n\n"
-                                "Based on the provided information, you may have an elevated risk "
-                                "for developing diabetes.")
-                    else:
-                        st.success("✅ **Lower Risk Detected**\n\n"
-                                 "Based on the provided information, you appear to have a lower "
-                                 "risk for developing diabetes.")
-                    
-                    st.info("""
-                        **Important Notice**: This assessment is for informational purposes only. 
-                        Please consult with a healthcare professional for proper medical advice 
-                        and diagnosis.
-                    """)
+    # Load the model up front so the unpacking cost is paid during app
+    # startup rather than inside the user's first click.
+    load_model()
+
+    # CSS and header section, emitted in a single call
+    st.markdown(_STATIC_HEAD, unsafe_allow_html=True)
+
+    # All inputs live in one form so widget changes do not rerun the
+    # script; Streamlit reruns once, on submit.
+    with st.form("risk_form"):
+        # Create three main columns for the form
+        left_col, middle_col, right_col = st.columns([1, 1, 1])
+
+        # Left Column - Basic Health Metrics
+        with left_col:
+            st.subheader("📊 Basic Health Metrics")
+
+            st.number_input(
+                "BMI (Body Mass Index)",
+                min_value=18.0,
+                max_value=50.0,
+                value=25.0,
+                step=0.1,
+                help="Body Mass Index is a measure of body fat based on height and weight",
+                key="bmi"
+            )
+
+            for key, label in LEFT_FIELDS:
+                st.selectbox(label, options=_YESNO, format_func=_fmt, key=key)
+
+        # Middle Column - Lifestyle Factors
+        with middle_col:
+            st.subheader("🎯 Lifestyle & Habits")
+
+            for key, label in MIDDLE_FIELDS:
+                st.selectbox(label, options=_YESNO, format_func=_fmt, key=key)
+
+        # Right Column - Personal Information
+        with right_col:
+            st.subheader("👤 Personal Information")
+
+            st.selectbox(
+                "Sex",
+                options=_SEX,
+                format_func=_fmt,
+                key="sex"
+            )
+
+            st.select_slider(
+                "Age Group",
+                options=range(1, 14),
+                format_func=lambda x, _L=_AGE_LABELS: _L[x-1],
+                key="age"
+            )
+
+            st.select_slider(
+                "Education Level",
+                options=range(1, 7),
+                format_func=lambda x, _L=_EDU_LABELS: _L[x-1],
+                key="education"
+            )
+
+            st.select_slider(
+                "Annual Income",
+                options=range(1, 9),
+                format_func=lambda x, _L=_INCOME_LABELS: _L[x-1],
+                key="income"
+            )
+
+        # Health Status Section - Full Width
+        st.markdown("---")
+        st.subheader("🏥 Health Status")
+
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.select_slider(
+                "General Health",
+                options=(1.0, 2.0, 3.0, 4.0, 5.0),
+                value=3.0,
+                format_func=lambda x, _L=_GEN_HEALTH_LABELS: _L[int(x-1)],
+                key="gen_health"
+            )
+
+        with col2:
+            st.slider(
+                "Days of Poor Mental Health (Last 30 days)",
+                min_value=0,
+                max_value=30,
+                value=0,
+                key="mental_health"
+            )
+
+        with col3:
+            st.slider(
+                "Days of Poor Physical Health (Last 30 days)",
+                min_value=0,
+                max_value=30,
+                value=0,
+                key="phys_health"
+            )
+
+        # Prediction Button
+        st.markdown("---")
+        col1, col2, col3 = st.columns([1, 2, 1])
+
+        with col2:
+            st.form_submit_button(
+                "Generate Risk Assessment", type="primary", on_click=_on_submit
+            )
+
+    # Results - read from session state; the submit callback already stored
+    # the prediction, so reruns render it without recomputing.
+    prediction_result = st.session_state.get("result")
+    if prediction_result is not None:
+        st.markdown("### Assessment Results")
+        if prediction_result == 1:
+            st.error("⚠️ **Higher Risk Detected**\n\n"
+                    "Based on the provided information, you may have an elevated risk "
+                    "for developing diabetes.")
+        else:
+            st.success("✅ **Lower Risk Detected**\n\n"
+                     "Based on the provided information, you appear to have a lower "
+                     "risk for developing diabetes.")
+
+        st.info("""
+            **Important Notice**: This assessment is for informational purposes only.
+            Please consult with a healthcare professional for proper medical advice
+            and diagnosis.
+        """)
 
     # Footer
     st.markdown("---")
-    st.markdown("""
-        <div style='text-align: center; color: #666;'>
-            <small>
-                This tool is for educational purposes only. Always consult with healthcare 
-                professionals for medical advice.
-            </small>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""One-time conversion of the trained sklearn model to ONNX.
+
+Run this offline whenever the model is retrained:
+
+    python convert_model.py
+
+Requires scikit-learn, joblib and skl2onnx (not needed at app runtime).
+
+Note: int8 dynamic quantization (onnxruntime.quantization.quantize_dynamic)
+was evaluated and does not apply here — the exported graph is a single
+ai.onnx.ml TreeEnsembleClassifier node whose thresholds are node attributes
+rather than weight initializers, and the quantizer rejects graphs without an
+ai.onnx domain opset.
+"""
+
+import warnings
+
+import joblib
+
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+from sklearn.exceptions import InconsistentVersionWarning
+
+# The model was trained on an older sklearn; deserializing it emits this
+# warning per estimator, which is just noise during conversion.
+warnings.simplefilter("ignore", InconsistentVersionWarning)
+
+N_FEATURES = 19
+
+
+def convert():
+    # mmap_mode keeps the estimator's numpy arrays memory-mapped instead of
+    # copied onto the heap.
+    model = joblib.load("predictor.joblib", mmap_mode="r")
+
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[("input", FloatTensorType([None, N_FEATURES]))],
+        options={id(model): {"zipmap": False}},
+    )
+
+    with open("predictor.onnx", "wb") as file:
+        file.write(onnx_model.SerializeToString())
+
+
+if __name__ == "__main__":
+    convert()